@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Filter Benchmark
+
+Compares the successive boolean-mask filtering that main.py used to do
+with the pre-indexed LaptopFilter, over many random filter combinations
+on a synthetic dataset.
+
+Usage:
+    python benchmarks/filter_benchmark.py --rows 200000 --queries 2000
+"""
+
+import os
+import sys
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.filter_engine import LaptopFilter
+
+
+def make_dataset(rows, seed=0):
+    """Build a synthetic cleaned laptop DataFrame."""
+    rng = np.random.default_rng(seed)
+    rating = rng.uniform(1, 5, rows).round(1)
+    rating[rng.random(rows) < 0.2] = np.nan
+    return pd.DataFrame({
+        'name': [f"Laptop {i}" for i in range(rows)],
+        'price': rng.lognormal(6.5, 0.5, rows).round(2),
+        'rating': rating,
+        'availability': rng.choice(['In Stock', 'Out of Stock'], rows, p=[0.85, 0.15]),
+        'site': rng.choice(['Amazon', 'Cdiscount', 'Boulanger'], rows),
+    })
+
+
+def make_queries(count, seed=1):
+    """Build random min_price/max_price/min_rating combinations."""
+    rng = np.random.default_rng(seed)
+    queries = []
+    for _ in range(count):
+        low = float(rng.uniform(200, 1500))
+        queries.append({
+            'min_price': low if rng.random() < 0.8 else None,
+            'max_price': low + float(rng.uniform(50, 1500)) if rng.random() < 0.8 else None,
+            'min_rating': float(rng.uniform(1, 5)) if rng.random() < 0.6 else None,
+        })
+    return queries
+
+
+def mask_filter(df, min_price=None, max_price=None, min_rating=None):
+    """Reference implementation: one boolean-mask copy per criterion."""
+    filtered_df = df.copy()
+    if min_price is not None:
+        filtered_df = filtered_df[filtered_df['price'] >= min_price]
+    if max_price is not None:
+        filtered_df = filtered_df[filtered_df['price'] <= max_price]
+    if min_rating is not None:
+        filtered_df = filtered_df[filtered_df['rating'] >= min_rating]
+    return filtered_df
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark boolean masks against LaptopFilter')
+    parser.add_argument('--rows', type=int, default=200000, help='Number of synthetic rows (default: 200000)')
+    parser.add_argument('--queries', type=int, default=2000, help='Number of filter combinations (default: 2000)')
+    args = parser.parse_args()
+
+    df = make_dataset(args.rows)
+    queries = make_queries(args.queries)
+
+    start = time.perf_counter()
+    engine = LaptopFilter(df)
+    build_time = time.perf_counter() - start
+
+    # Sanity check: both approaches must select the same rows
+    for query in queries[:50]:
+        expected = mask_filter(df, **query).index.to_numpy()
+        assert np.array_equal(expected, engine.positions(**query)), query
+
+    start = time.perf_counter()
+    for query in queries:
+        mask_filter(df, **query)
+    mask_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for query in queries:
+        engine.apply(**query)
+    engine_frame_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for query in queries:
+        engine.positions(**query)
+    engine_positions_time = time.perf_counter() - start
+
+    print(f"Rows: {args.rows} | Queries: {args.queries}")
+    print(f"LaptopFilter build:        {build_time * 1000:.1f} ms")
+    print(f"Boolean masks:             {mask_time / args.queries * 1e6:.1f} µs/query")
+    print(f"LaptopFilter.apply:        {engine_frame_time / args.queries * 1e6:.1f} µs/query "
+          f"({mask_time / engine_frame_time:.1f}x)")
+    print(f"LaptopFilter.positions:    {engine_positions_time / args.queries * 1e6:.1f} µs/query "
+          f"({mask_time / engine_positions_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
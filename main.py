@@ -14,7 +14,12 @@ from scraper.amazon import scrape_amazon
 from scraper.cdiscount import scrape_cdiscount
 from scraper.boulanger import scrape_boulanger
 from utils.data_cleaning import clean_data, combine_data
-from utils.visualizer import create_price_histogram, display_statistics
+from utils.visualizer import create_price_histogram, display_statistics, display_history_statistics
+from utils.filter_engine import LaptopFilter
+from utils.api_server import serve
+from utils.streaming_stats import PriceHistoryStatistics
+from utils.price_alerts import (load_price_state, detect_price_changes, update_price_state,
+                                save_price_state, write_alerts_jsonl, send_alerts_webhook)
 
 def main():
     """Main function to run the laptop price scraper and analyzer."""
@@ -28,8 +33,26 @@ def main():
     parser.add_argument('--min-rating', type=float, help='Minimum rating filter (1-5)')
     parser.add_argument('--limit', type=int, default=20, help='Limit number of products per site (default: 20)')
     parser.add_argument('--output', type=str, default='laptops.csv', help='Output CSV filename')
+    parser.add_argument('--alert-drop', type=float, default=10.0,
+                        help='Report price drops of at least this percentage since the last run (default: 10)')
+    parser.add_argument('--alerts-file', type=str, default='alerts.jsonl',
+                        help='JSON Lines file receiving price/stock alerts (default: alerts.jsonl)')
+    parser.add_argument('--alert-webhook', type=str, help='Optional URL to POST price/stock alerts to')
+    parser.add_argument('--history-stats', action='store_true',
+                        help='Also display statistics accumulated over all previous runs')
+    parser.add_argument('--serve', action='store_true',
+                        help='Serve the latest output CSV over a local JSON API instead of scraping')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='API server host (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8000, help='API server port (default: 8000)')
     args = parser.parse_args()
     
+    if args.alert_drop < 0:
+        parser.error('--alert-drop must be zero or a positive percentage')
+    
+    if args.serve:
+        serve(os.path.join('output', args.output), host=args.host, port=args.port)
+        return
+    
     print(f"\n{'=' * 60}")
     print(f"🔍 LAPTOP PRICE SCRAPER AND ANALYZER")
     print(f"{'=' * 60}")
@@ -67,28 +90,43 @@ def main():
     combined_df = combine_data(all_data)
     cleaned_df = clean_data(combined_df)
     
-    # Apply filters if specified
-    filtered_df = cleaned_df.copy()
-    filter_applied = False
-    
-    if args.min_price is not None:
-        filtered_df = filtered_df[filtered_df['price'] >= args.min_price]
-        filter_applied = True
+    # Detect price drops and stock changes since the last run
+    print("\n🔔 Checking for price and stock changes...")
+    state_path = os.path.join('output', 'price_state.csv')
+    price_state = load_price_state(state_path)
+    alerts = detect_price_changes(cleaned_df, price_state, drop_threshold=args.alert_drop)
+    if alerts.empty:
+        print("No price drops or stock changes since the last run")
+    else:
+        alerts_path = os.path.join('output', args.alerts_file)
+        write_alerts_jsonl(alerts, alerts_path)
+        if args.alert_webhook:
+            send_alerts_webhook(alerts, args.alert_webhook)
+        for event, count in alerts['event'].value_counts().items():
+            print(f"{event}:".ljust(15) + f"{count} products")
+        print(f"🔔 Alerts written to {alerts_path}")
+    save_price_state(update_price_state(cleaned_df, price_state), state_path)
     
-    if args.max_price is not None:
-        filtered_df = filtered_df[filtered_df['price'] <= args.max_price]
-        filter_applied = True
+    # Fold this run into the streaming price history
+    history_path = os.path.join('output', 'price_history_stats.json')
+    history = PriceHistoryStatistics.load(history_path)
+    history.update(cleaned_df)
+    history.save(history_path)
     
-    if args.min_rating is not None:
-        filtered_df = filtered_df[filtered_df['rating'] >= args.min_rating]
-        filter_applied = True
+    # Apply filters if specified
+    filter_applied = any(value is not None for value in (args.min_price, args.max_price, args.min_rating))
+    filtered_df = LaptopFilter(cleaned_df).apply(min_price=args.min_price,
+                                                 max_price=args.max_price,
+                                                 min_rating=args.min_rating)
     
     if filter_applied:
         print(f"🔍 Applied filters: {len(filtered_df)} products remaining")
     
-    # Save to CSV
+    # Save to CSV (write then rename, so a running API server never reads a partial file)
     output_path = os.path.join('output', args.output)
-    filtered_df.to_csv(output_path, index=False)
+    tmp_path = output_path + '.tmp'
+    filtered_df.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, output_path)
     print(f"\n💾 Data saved to {output_path}")
     
     # Generate visualizations
@@ -104,6 +142,10 @@ def main():
     else:
         print("\n⚠️ No data after filtering. Cannot generate visualizations.")
     
+    if args.history_stats:
+        print("\n📚 Price History Summary:")
+        display_history_statistics(history)
+    
     print(f"\n✅ Process completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'=' * 60}\n")
 
@@ -0,0 +1,3 @@
+"""
+Initialization file for the tests package.
+"""
\ No newline at end of file
@@ -0,0 +1,57 @@
+"""
+Tests for the price alert utilities.
+"""
+
+import pandas as pd
+
+from utils.price_alerts import STATE_COLUMNS, detect_price_changes, update_price_state
+
+
+def make_run(availability=('In Stock', 'In Stock'), prices=(500.0, 700.0)):
+    """Build a cleaned run with two distinct products on one site."""
+    return pd.DataFrame({
+        'name': ['Acer Swift', 'Asus Zenbook'],
+        'price': list(prices),
+        'rating': [4.5, 4.0],
+        'availability': list(availability),
+        'site': ['Amazon', 'Amazon'],
+    })
+
+
+def make_state(run):
+    return update_price_state(run, pd.DataFrame(columns=STATE_COLUMNS))
+
+
+def test_single_product_going_out_of_stock_emits_one_event():
+    state = make_state(make_run())
+    events = detect_price_changes(make_run(availability=('In Stock', 'Out of Stock')), state)
+    assert events[['event', 'name']].values.tolist() == [['out_of_stock', 'Asus Zenbook']]
+
+
+def test_single_product_back_in_stock_emits_one_event():
+    state = make_state(make_run(availability=('Out of Stock', 'In Stock')))
+    events = detect_price_changes(make_run(), state)
+    assert events[['event', 'name']].values.tolist() == [['back_in_stock', 'Acer Swift']]
+
+
+def test_zero_threshold_ignores_unchanged_prices():
+    run = make_run()
+    events = detect_price_changes(run, make_state(run), drop_threshold=0)
+    assert events.empty
+
+
+def test_zero_threshold_reports_any_real_drop():
+    state = make_state(make_run())
+    events = detect_price_changes(make_run(prices=(499.0, 700.0)), state, drop_threshold=0)
+    assert events[['event', 'name']].values.tolist() == [['price_drop', 'Acer Swift']]
+
+
+def test_price_increase_is_not_a_drop():
+    state = make_state(make_run())
+    events = detect_price_changes(make_run(prices=(600.0, 700.0)), state, drop_threshold=0)
+    assert events.empty
+
+
+def test_placeholder_names_are_not_tracked():
+    run = make_run().assign(name='Unknown Laptop')
+    assert make_state(run).empty
@@ -0,0 +1,386 @@
+"""
+Local Query API
+
+This module serves the latest cleaned laptop dataset over a small local
+JSON/HTTP API so the front end (or any other client) does not have to
+re-read the CSV on every request.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from utils.filter_engine import LaptopFilter
+
+SORT_FIELDS = ('price', 'rating')
+DEFAULT_PER_PAGE = 20
+MAX_PER_PAGE = 200
+RESPONSE_CACHE_SIZE = 256
+GZIP_MIN_BYTES = 512
+
+# Errors raised when the CSV is missing, empty or not a cleaned laptop dataset
+LOAD_ERRORS = (OSError, ValueError, KeyError, pd.errors.ParserError)
+
+
+class LaptopDataset:
+    """
+    In-memory snapshot of a cleaned laptop CSV with precomputed indexes.
+
+    Every row is serialised to JSON once at load time and filtering goes
+    through a LaptopFilter, whose price/rating sort orders are reused for
+    the response ordering, so answering a query only involves a binary
+    search, a boolean mask and joining ready-made JSON fragments.
+    """
+
+    def __init__(self, df, version):
+        """
+        Build the indexes for a cleaned DataFrame.
+
+        Args:
+            df (pandas.DataFrame): Cleaned laptop data
+            version (str): Identifier of the file the data was loaded from
+        """
+        self.version = version
+        self.loaded_at = time.time()
+        self.size = len(df)
+        self.sites = sorted(df['site'].dropna().unique().tolist()) if 'site' in df.columns else []
+
+        self.index = LaptopFilter(df)
+
+        records = df.astype(object).where(df.notna(), None).to_dict(orient='records')
+        self.rows = [json.dumps(record, ensure_ascii=False).encode('utf-8') for record in records]
+
+    @classmethod
+    def from_csv(cls, path):
+        """
+        Load a dataset from a CSV file written by the scraper.
+
+        Args:
+            path (str): Path to the cleaned CSV file
+
+        Returns:
+            LaptopDataset: Indexed dataset
+        """
+        stat = os.stat(path)
+        df = pd.read_csv(path)
+        return cls(df, version=f"{stat.st_mtime_ns:x}-{stat.st_size:x}")
+
+    def query(self, min_price=None, max_price=None, min_rating=None, sites=None,
+              availability=None, sort='price', order='asc', page=1, per_page=DEFAULT_PER_PAGE):
+        """
+        Select, sort and paginate rows.
+
+        Args:
+            min_price (float): Minimum price filter
+            max_price (float): Maximum price filter
+            min_rating (float): Minimum rating filter (1-5)
+            sites (list): Site names to keep
+            availability (list): Availability statuses to keep
+            sort (str): Field to sort on ('price' or 'rating')
+            order (str): 'asc' or 'desc'
+            page (int): 1-based page number
+            per_page (int): Number of rows per page
+
+        Returns:
+            tuple: (total number of matching rows, list of row positions for the page)
+        """
+        index = self.index
+        mask = index.mask(min_price=min_price, max_price=max_price, min_rating=min_rating,
+                          sites=sites, availability=availability)
+
+        if sort == 'price':
+            sort_order, valid = index.price_order, index.price_valid
+        else:
+            sort_order, valid = index.rating_order, index.rating_valid
+        if order == 'desc':
+            # Reverse the non-NaN part only so unrated rows stay at the end
+            sort_order = np.concatenate((sort_order[:valid][::-1], sort_order[valid:]))
+
+        matches = sort_order[mask[sort_order]]
+        start = (page - 1) * per_page
+        return len(matches), matches[start:start + per_page]
+
+    def render(self, total, positions, page, per_page):
+        """
+        Assemble the JSON body for a query result.
+
+        Args:
+            total (int): Number of matching rows
+            positions (numpy.ndarray): Row positions for the requested page
+            page (int): 1-based page number
+            per_page (int): Number of rows per page
+
+        Returns:
+            bytes: UTF-8 encoded JSON document
+        """
+        header = json.dumps({
+            'version': self.version,
+            'total': int(total),
+            'page': page,
+            'per_page': per_page,
+        })[:-1].encode('utf-8')
+        items = b','.join(self.rows[i] for i in positions)
+        return header + b', "items": [' + items + b']}'
+
+
+class DatasetStore:
+    """
+    Holds the current dataset and swaps it when the CSV file changes.
+
+    Readers grab ``store.dataset`` once per request; a reload builds a new
+    LaptopDataset off to the side and replaces the reference, so requests
+    never see a half-built index.
+    """
+
+    def __init__(self, path, reload_interval=2.0):
+        """
+        Args:
+            path (str): Path to the cleaned CSV file
+            reload_interval (float): Seconds between checks for a new run
+        """
+        self.path = path
+        self.reload_interval = reload_interval
+        self.dataset = LaptopDataset.from_csv(path)
+        self._last_warning = None
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def _file_version(self):
+        stat = os.stat(self.path)
+        return f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+
+    def reload_if_changed(self):
+        """
+        Reload the dataset if the CSV file has been replaced.
+
+        A failed reload keeps serving the previous dataset and is reported
+        once per distinct file version and error, not on every poll.
+
+        Returns:
+            bool: True if a new dataset was loaded
+        """
+        version = None
+        try:
+            version = self._file_version()
+            if version == self.dataset.version:
+                return False
+            dataset = LaptopDataset.from_csv(self.path)
+        except LOAD_ERRORS as e:
+            warning = (version, f"{type(e).__name__}: {e}")
+            if warning != self._last_warning:
+                self._last_warning = warning
+                print(f"⚠️ Could not reload {self.path}: {e}")
+            return False
+
+        with self._lock:
+            self.dataset = dataset
+            self._cache.clear()
+        self._last_warning = None
+        print(f"🔄 Reloaded {self.path} ({dataset.size} products)")
+        return True
+
+    def watch(self):
+        """Start a daemon thread that polls the CSV file for changes."""
+        def _loop():
+            while not self._stop.wait(self.reload_interval):
+                self.reload_if_changed()
+
+        thread = threading.Thread(target=_loop, name='dataset-reloader', daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        """Stop the reload thread."""
+        self._stop.set()
+
+    def cached(self, key):
+        """Return a cached (body, etag, gzipped) entry or None."""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+            return entry
+
+    def remember(self, key, entry):
+        """Store a rendered response in the LRU cache."""
+        with self._lock:
+            self._cache[key] = entry
+            if len(self._cache) > RESPONSE_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+
+def parse_query(query_string):
+    """
+    Parse and validate query-string parameters.
+
+    Args:
+        query_string (str): Raw query string of the request
+
+    Returns:
+        dict: Keyword arguments for LaptopDataset.query
+
+    Raises:
+        ValueError: If a parameter is malformed
+    """
+    multi = parse_qs(query_string)
+    params = {key: values[-1] for key, values in multi.items()}
+
+    def _list(name):
+        if name not in multi:
+            return None
+        return [item for value in multi[name] for item in value.split(',') if item]
+
+    def _float(name):
+        if name not in params:
+            return None
+        try:
+            return float(params[name])
+        except ValueError:
+            raise ValueError(f"'{name}' must be a number")
+
+    def _int(name, default, minimum, maximum):
+        try:
+            value = int(params.get(name, default))
+        except ValueError:
+            raise ValueError(f"'{name}' must be an integer")
+        if not minimum <= value <= maximum:
+            raise ValueError(f"'{name}' must be between {minimum} and {maximum}")
+        return value
+
+    sort = params.get('sort', 'price')
+    if sort not in SORT_FIELDS:
+        raise ValueError(f"'sort' must be one of {', '.join(SORT_FIELDS)}")
+    order = params.get('order', 'asc')
+    if order not in ('asc', 'desc'):
+        raise ValueError("'order' must be 'asc' or 'desc'")
+
+    return {
+        'min_price': _float('min_price'),
+        'max_price': _float('max_price'),
+        'min_rating': _float('min_rating'),
+        'sites': _list('site'),
+        'availability': _list('availability'),
+        'sort': sort,
+        'order': order,
+        'page': _int('page', 1, 1, 10 ** 9),
+        'per_page': _int('per_page', DEFAULT_PER_PAGE, 1, MAX_PER_PAGE),
+    }
+
+
+class LaptopRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler exposing /api/laptops and /api/meta."""
+
+    store = None
+    server_version = 'LaptopPriceAPI/1.0'
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == '/api/laptops':
+            self._serve_laptops(url.query)
+        elif url.path == '/api/meta':
+            dataset = self.store.dataset
+            body = json.dumps({
+                'version': dataset.version,
+                'count': dataset.size,
+                'sites': dataset.sites,
+                'loaded_at': dataset.loaded_at,
+            }).encode('utf-8')
+            self._send(200, body, etag=f'"{dataset.version}"')
+        else:
+            self._send_error(404, 'Not found')
+
+    def _serve_laptops(self, query_string):
+        dataset = self.store.dataset
+        key = (dataset.version, query_string)
+        entry = self.store.cached(key)
+
+        if entry is None:
+            try:
+                params = parse_query(query_string)
+            except ValueError as e:
+                self._send_error(400, str(e))
+                return
+            total, positions = dataset.query(**params)
+            body = dataset.render(total, positions, params['page'], params['per_page'])
+            etag = '"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+            compressed = gzip.compress(body, compresslevel=5) if len(body) >= GZIP_MIN_BYTES else None
+            entry = (body, etag, compressed)
+            self.store.remember(key, entry)
+
+        body, etag, compressed = entry
+        self._send(200, body, etag=etag, compressed=compressed)
+
+    def _send(self, status, body, etag=None, compressed=None):
+        if etag is not None and self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            return
+
+        use_gzip = compressed is not None and 'gzip' in self.headers.get('Accept-Encoding', '')
+        payload = compressed if use_gzip else body
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Vary', 'Accept-Encoding')
+        if etag is not None:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+        if use_gzip:
+            self.send_header('Content-Encoding', 'gzip')
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_error(self, status, message):
+        self._send(status, json.dumps({'error': message}).encode('utf-8'))
+
+    def log_message(self, format, *args):
+        # Keep the console readable; the scraper output uses its own format
+        pass
+
+
+def serve(csv_path, host='127.0.0.1', port=8000, reload_interval=2.0):
+    """
+    Serve the cleaned dataset until interrupted.
+
+    Args:
+        csv_path (str): Path to the cleaned CSV file
+        host (str): Interface to bind
+        port (int): Port to listen on
+        reload_interval (float): Seconds between checks for a new run
+    """
+    try:
+        store = DatasetStore(csv_path, reload_interval=reload_interval)
+    except FileNotFoundError:
+        print(f"❌ No dataset at {csv_path}, run the scraper first.")
+        return
+    except LOAD_ERRORS as e:
+        print(f"❌ Could not load {csv_path}: {e}")
+        return
+    store.watch()
+
+    handler = type('BoundLaptopRequestHandler', (LaptopRequestHandler,), {'store': store})
+    httpd = ThreadingHTTPServer((host, port), handler)
+
+    print(f"🌐 Serving {store.dataset.size} products from {csv_path}")
+    print(f"   http://{host}:{port}/api/laptops?min_price=&max_price=&min_rating=&sort=price&order=asc&page=1")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 Server stopped")
+    finally:
+        store.stop()
+        httpd.server_close()
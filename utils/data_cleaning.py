@@ -7,6 +7,12 @@ This module provides functions for cleaning and processing laptop data.
 import pandas as pd
 import re
 
+# Name given to products whose name could not be scraped
+UNKNOWN_LAPTOP_NAME = "Unknown Laptop"
+
+# Names that do not identify a product
+PLACEHOLDER_NAMES = {UNKNOWN_LAPTOP_NAME, 'N/A', ''}
+
 def clean_data(df):
     """
     Clean and standardize the scraped laptop data.
@@ -80,7 +86,7 @@ def standardize_name(name):
         str: Standardized laptop name
     """
     if pd.isna(name) or name == "N/A":
-        return "Unknown Laptop"
+        return UNKNOWN_LAPTOP_NAME
     
     # Remove excessive whitespace
     name = re.sub(r'\s+', ' ', name)
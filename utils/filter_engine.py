@@ -0,0 +1,159 @@
+"""
+Filter Engine
+
+This module provides a reusable, pre-indexed filter over cleaned laptop
+data, for running many price/rating/site/availability queries against
+the same DataFrame without copying it for every criterion.
+"""
+
+import numpy as np
+
+
+class LaptopFilter:
+    """
+    Pre-indexed multi-criteria filter for a cleaned laptop DataFrame.
+
+    Price and rating are kept as sorted arrays so range criteria resolve
+    to a slice via binary search; ``site`` and ``availability`` get one
+    boolean bitmap per distinct value. A query starts from the smallest
+    range slice and checks the remaining criteria on those rows only, so
+    no intermediate DataFrame is built until the final selection.
+    """
+
+    def __init__(self, df):
+        """
+        Build the indexes.
+
+        Args:
+            df (pandas.DataFrame): Cleaned laptop data
+        """
+        self.df = df
+        self.size = len(df)
+
+        self.price = df['price'].to_numpy(dtype=float)
+        self.rating = (df['rating'].to_numpy(dtype=float) if 'rating' in df.columns
+                       else np.full(self.size, np.nan))
+
+        # argsort puts NaN last, so the first *_valid entries are the comparable ones
+        self.price_order = np.argsort(self.price, kind='stable')
+        self.rating_order = np.argsort(self.rating, kind='stable')
+        self.sorted_price = self.price[self.price_order]
+        self.sorted_rating = self.rating[self.rating_order]
+        self.price_valid = int(np.count_nonzero(~np.isnan(self.price)))
+        self.rating_valid = int(np.count_nonzero(~np.isnan(self.rating)))
+
+        self.bitmaps = {
+            column: self._build_bitmaps(df[column]) if column in df.columns else {}
+            for column in ('site', 'availability')
+        }
+
+    @staticmethod
+    def _build_bitmaps(series):
+        codes, uniques = series.factorize()
+        return {value: codes == code for code, value in enumerate(uniques)}
+
+    def _range(self, order, sorted_values, valid, low, high):
+        """Return the row positions whose value lies in [low, high]."""
+        lo = 0 if low is None else np.searchsorted(sorted_values[:valid], low, side='left')
+        hi = valid if high is None else np.searchsorted(sorted_values[:valid], high, side='right')
+        return order[lo:max(lo, hi)]
+
+    def _bitmap(self, column, values):
+        """OR together the bitmaps of the requested values of a column."""
+        if isinstance(values, str):
+            values = [values]
+        bitmaps = [self.bitmaps[column][v] for v in values if v in self.bitmaps[column]]
+        if not bitmaps:
+            return np.zeros(self.size, dtype=bool)
+        combined = bitmaps[0]
+        for bitmap in bitmaps[1:]:
+            combined = combined | bitmap
+        return combined
+
+    def positions(self, min_price=None, max_price=None, min_rating=None,
+                  max_rating=None, sites=None, availability=None):
+        """
+        Find the rows matching every given criterion.
+
+        Args:
+            min_price (float): Minimum price filter
+            max_price (float): Maximum price filter
+            min_rating (float): Minimum rating filter (1-5)
+            max_rating (float): Maximum rating filter (1-5)
+            sites (str or list): Site name(s) to keep
+            availability (str or list): Availability status(es) to keep
+
+        Returns:
+            numpy.ndarray: Matching row positions, in original row order
+        """
+        price_filtered = min_price is not None or max_price is not None
+        rating_filtered = min_rating is not None or max_rating is not None
+
+        candidates = None
+        if price_filtered:
+            candidates = self._range(self.price_order, self.sorted_price, self.price_valid,
+                                     min_price, max_price)
+        if rating_filtered:
+            by_rating = self._range(self.rating_order, self.sorted_rating, self.rating_valid,
+                                    min_rating, max_rating)
+            if candidates is None or len(by_rating) < len(candidates):
+                # Drive the query from the narrower range, check the other on those rows
+                if price_filtered:
+                    price = self.price[by_rating]
+                    keep = np.ones(len(by_rating), dtype=bool)
+                    if min_price is not None:
+                        keep &= price >= min_price
+                    if max_price is not None:
+                        keep &= price <= max_price
+                    by_rating = by_rating[keep]
+                candidates = by_rating
+            else:
+                rating = self.rating[candidates]
+                keep = ~np.isnan(rating)
+                if min_rating is not None:
+                    keep &= rating >= min_rating
+                if max_rating is not None:
+                    keep &= rating <= max_rating
+                candidates = candidates[keep]
+
+        for column, values in (('site', sites), ('availability', availability)):
+            if values is None:
+                continue
+            bitmap = self._bitmap(column, values)
+            if candidates is None:
+                candidates = np.flatnonzero(bitmap)
+            else:
+                candidates = candidates[bitmap[candidates]]
+
+        if candidates is None:
+            return np.arange(self.size)
+        return np.sort(candidates)
+
+    def mask(self, **criteria):
+        """
+        Boolean row mask for the given criteria (see ``positions``).
+
+        Returns:
+            numpy.ndarray: Boolean array with one entry per row
+        """
+        mask = np.zeros(self.size, dtype=bool)
+        mask[self.positions(**criteria)] = True
+        return mask
+
+    def count(self, **criteria):
+        """
+        Number of rows matching the given criteria (see ``positions``).
+
+        Returns:
+            int: Number of matching rows
+        """
+        return len(self.positions(**criteria))
+
+    def apply(self, **criteria):
+        """
+        Filtered DataFrame for the given criteria (see ``positions``).
+
+        Returns:
+            pandas.DataFrame: Matching rows with a fresh index
+        """
+        return self.df.iloc[self.positions(**criteria)].reset_index(drop=True)
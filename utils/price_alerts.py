@@ -0,0 +1,188 @@
+"""
+Price Alert Utilities
+
+This module detects price drops and stock changes between runs by
+comparing the latest scrape against a compact per-product state file.
+"""
+
+import os
+import json
+from datetime import datetime
+
+import pandas as pd
+import requests
+
+from utils.data_cleaning import PLACEHOLDER_NAMES
+
+KEY_COLUMNS = ['site', 'name']
+STATE_COLUMNS = KEY_COLUMNS + ['price', 'availability', 'last_seen']
+
+
+def load_price_state(path):
+    """
+    Load the last seen price and availability of every product.
+
+    Args:
+        path (str): Path to the state CSV file
+
+    Returns:
+        pandas.DataFrame: State with one row per (site, name)
+    """
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=STATE_COLUMNS)
+    state_df = pd.read_csv(path)
+    # Drop placeholder rows that older state files may still contain
+    names = state_df['name'].fillna('').astype(str).str.strip()
+    return state_df[~names.isin(PLACEHOLDER_NAMES)].reset_index(drop=True)
+
+
+def save_price_state(state_df, path):
+    """
+    Save the product state, replacing the previous file atomically.
+
+    Args:
+        state_df (pandas.DataFrame): State returned by update_price_state
+        path (str): Path to the state CSV file
+    """
+    tmp_path = path + '.tmp'
+    state_df.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def _latest_observations(df, seen_at):
+    """
+    Reduce a run to one row per identifiable product.
+
+    Rows whose name is missing or a placeholder such as "Unknown Laptop"
+    cannot be told apart, so they are left out of the state and of change
+    detection. Several listings sharing the same (site, name) are treated
+    as one product: its price is the cheapest listing and it counts as
+    "In Stock" if any listing is, otherwise the first listing's status.
+
+    Args:
+        df (pandas.DataFrame): Cleaned laptop data from the current run
+        seen_at (str): Timestamp stored in the last_seen column
+
+    Returns:
+        pandas.DataFrame: One row per (site, name) with price and availability
+    """
+    current = df[KEY_COLUMNS + ['price', 'availability']].dropna(subset=['price', 'name'])
+    names = current['name'].astype(str).str.strip()
+    current = current[~names.isin(PLACEHOLDER_NAMES)]
+
+    in_stock = (current['availability'] == 'In Stock').rename('in_stock')
+    grouped = current.assign(in_stock=in_stock).groupby(KEY_COLUMNS, sort=False)
+    products = grouped.agg(price=('price', 'min'), availability=('availability', 'first'),
+                           in_stock=('in_stock', 'any')).reset_index()
+    products.loc[products['in_stock'], 'availability'] = 'In Stock'
+    return products.drop(columns='in_stock').assign(last_seen=seen_at)
+
+
+def detect_price_changes(df, state_df, drop_threshold=10.0):
+    """
+    Compare a run against the stored state and list threshold events.
+
+    Args:
+        df (pandas.DataFrame): Cleaned laptop data from the current run
+        state_df (pandas.DataFrame): State from load_price_state
+        drop_threshold (float): Minimum price drop, in percent, to report;
+            any real decrease is reported when it is 0
+
+    Returns:
+        pandas.DataFrame: One row per event with columns event, site, name,
+            old_price, new_price, change_pct, old_availability, availability
+    """
+    current = _latest_observations(df, seen_at=None)
+    merged = current.merge(state_df[KEY_COLUMNS + ['price', 'availability']],
+                           on=KEY_COLUMNS, how='inner', suffixes=('', '_old'))
+
+    change_pct = (merged['price'] - merged['price_old']) / merged['price_old'] * 100
+    was_in = merged['availability_old'] == 'In Stock'
+    was_out = merged['availability_old'] == 'Out of Stock'
+    is_in = merged['availability'] == 'In Stock'
+    is_out = merged['availability'] == 'Out of Stock'
+
+    conditions = {
+        'price_drop': (change_pct < 0) & (change_pct <= -drop_threshold),
+        'back_in_stock': was_out & is_in,
+        'out_of_stock': was_in & is_out,
+    }
+
+    events = []
+    for event, condition in conditions.items():
+        selected = merged[condition]
+        events.append(pd.DataFrame({
+            'event': event,
+            'site': selected['site'],
+            'name': selected['name'],
+            'old_price': selected['price_old'],
+            'new_price': selected['price'],
+            'change_pct': change_pct[condition].round(2),
+            'old_availability': selected['availability_old'],
+            'availability': selected['availability'],
+        }))
+
+    return pd.concat(events, ignore_index=True)
+
+
+def update_price_state(df, state_df):
+    """
+    Fold a run into the product state.
+
+    Products seen in this run take their new price and availability;
+    products not seen keep their previous entry.
+
+    Args:
+        df (pandas.DataFrame): Cleaned laptop data from the current run
+        state_df (pandas.DataFrame): State from load_price_state
+
+    Returns:
+        pandas.DataFrame: Updated state with one row per (site, name)
+    """
+    current = _latest_observations(df, seen_at=datetime.now().isoformat(timespec='seconds'))
+    if state_df.empty:
+        return current.reset_index(drop=True)
+
+    seen = pd.MultiIndex.from_frame(state_df[KEY_COLUMNS]).isin(pd.MultiIndex.from_frame(current[KEY_COLUMNS]))
+    return pd.concat([current, state_df.loc[~seen, STATE_COLUMNS]], ignore_index=True)
+
+
+def write_alerts_jsonl(events_df, path):
+    """
+    Append events to a JSON Lines file.
+
+    Args:
+        events_df (pandas.DataFrame): Events from detect_price_changes
+        path (str): Path to the JSONL file
+    """
+    if events_df.empty:
+        return
+    detected_at = datetime.now().isoformat(timespec='seconds')
+    records = events_df.assign(detected_at=detected_at)
+    with open(path, 'a', encoding='utf-8') as f:
+        lines = records.to_json(orient='records', lines=True, force_ascii=False)
+        f.write(lines if lines.endswith('\n') else lines + '\n')
+
+
+def send_alerts_webhook(events_df, url, timeout=10):
+    """
+    POST events as a JSON array to a webhook URL.
+
+    Args:
+        events_df (pandas.DataFrame): Events from detect_price_changes
+        url (str): Webhook endpoint
+        timeout (float): Request timeout in seconds
+
+    Returns:
+        bool: True if the webhook accepted the events
+    """
+    if events_df.empty:
+        return True
+    payload = json.loads(events_df.to_json(orient='records', force_ascii=False))
+    try:
+        response = requests.post(url, json={'events': payload}, timeout=timeout)
+        response.raise_for_status()
+        return True
+    except requests.RequestException as e:
+        print(f"Error sending alerts to webhook: {e}")
+        return False
@@ -0,0 +1,433 @@
+"""
+Streaming Statistics Utilities
+
+This module keeps approximate, mergeable summaries of every price
+observation ever scraped, so long-running history can be summarised
+with constant memory instead of re-reading and sorting all past runs.
+"""
+
+import os
+import json
+import math
+
+import numpy as np
+
+from utils.data_cleaning import PLACEHOLDER_NAMES, UNKNOWN_LAPTOP_NAME
+
+
+class RunningMoments:
+    """Count, mean, variance, minimum and maximum, updated in chunks."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def update(self, values):
+        """
+        Add a chunk of values (NaN values are ignored).
+
+        Args:
+            values (array-like): Numeric values
+        """
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+        chunk = RunningMoments()
+        chunk.count = int(values.size)
+        chunk.mean = float(values.mean())
+        chunk.m2 = float(((values - chunk.mean) ** 2).sum())
+        chunk.min = float(values.min())
+        chunk.max = float(values.max())
+        self.merge(chunk)
+
+    def merge(self, other):
+        """
+        Fold another RunningMoments into this one (Chan et al. parallel update).
+
+        Args:
+            other (RunningMoments): Summary to merge
+        """
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / count
+        self.mean += delta * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def std(self):
+        """Sample standard deviation, matching pandas' default (ddof=1)."""
+        if self.count < 2:
+            return math.nan
+        return math.sqrt(self.m2 / (self.count - 1))
+
+    def to_dict(self):
+        return {'count': self.count, 'mean': self.mean, 'm2': self.m2,
+                'min': self.min if self.count else None, 'max': self.max if self.count else None}
+
+    @classmethod
+    def from_dict(cls, data):
+        moments = cls()
+        moments.count = data['count']
+        moments.mean = data['mean']
+        moments.m2 = data['m2']
+        moments.min = data['min'] if data['min'] is not None else math.inf
+        moments.max = data['max'] if data['max'] is not None else -math.inf
+        return moments
+
+
+class QuantileSketch:
+    """
+    Log-bucketed quantile sketch (DDSketch) for positive values.
+
+    Every estimate is within ``relative_accuracy`` of a true quantile.
+    The number of buckets is capped at ``max_bins``; beyond that the
+    lowest buckets are collapsed, which only affects the smallest values.
+    """
+
+    def __init__(self, relative_accuracy=0.01, max_bins=2048):
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.bins = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def update(self, values):
+        """
+        Add a chunk of values (NaN values are ignored).
+
+        Args:
+            values (array-like): Numeric values
+        """
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+        positive = values[values > 0]
+        self.zero_count += int(values.size - positive.size)
+        self.count += int(values.size)
+
+        keys, counts = np.unique(np.ceil(np.log(positive) / self._log_gamma).astype(int),
+                                 return_counts=True)
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            self.bins[key] = self.bins.get(key, 0) + count
+        self._collapse()
+
+    def merge(self, other):
+        """
+        Fold another sketch with the same accuracy into this one.
+
+        Args:
+            other (QuantileSketch): Sketch to merge
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for key, count in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self._collapse()
+
+    def _collapse(self):
+        if len(self.bins) <= self.max_bins:
+            return
+        keys = sorted(self.bins)
+        excess = keys[:len(keys) - self.max_bins + 1]
+        target = excess[-1]
+        self.bins[target] = sum(self.bins.pop(key) for key in excess[:-1]) + self.bins[target]
+
+    def quantile(self, q):
+        """
+        Estimate the q-th quantile.
+
+        Args:
+            q (float): Quantile between 0 and 1
+
+        Returns:
+            float: Estimated value, or NaN if the sketch is empty
+        """
+        if self.count == 0:
+            return math.nan
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen > rank:
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.bins) / (self.gamma + 1)
+
+    def to_dict(self):
+        return {'relative_accuracy': self.relative_accuracy, 'max_bins': self.max_bins,
+                'zero_count': self.zero_count, 'count': self.count,
+                'bins': {str(key): count for key, count in self.bins.items()}}
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(data['relative_accuracy'], data['max_bins'])
+        sketch.zero_count = data['zero_count']
+        sketch.count = data['count']
+        sketch.bins = {int(key): count for key, count in data['bins'].items()}
+        return sketch
+
+
+class TopN:
+    """
+    Bounded list of the ``n`` best-scoring products.
+
+    Entries are keyed by (site, name), keeping only each product's best
+    score, so the same listing seen in many runs appears once. Rows with a
+    placeholder name such as "Unknown Laptop" cannot be told apart and are
+    keyed by (site, name, price) instead. When full, the lowest score is
+    evicted, so memory stays at ``n`` entries.
+    """
+
+    def __init__(self, n=5):
+        self.n = n
+        self._best = {}
+
+    @staticmethod
+    def key(record):
+        """Identify the product a record belongs to."""
+        name = str(record['name']).strip()
+        if name in PLACEHOLDER_NAMES:
+            return (record['site'], name, record['price'])
+        return (record['site'], name)
+
+    def _min_key(self):
+        return min(self._best, key=lambda k: self._best[k][0])
+
+    def push(self, score, record):
+        """
+        Offer a record; it is kept only if it ranks in the current top ``n``.
+
+        Args:
+            score (float): Ranking score (higher is better)
+            record (dict): Data to keep alongside the score
+        """
+        key = self.key(record)
+        if key in self._best:
+            if score > self._best[key][0]:
+                self._best[key] = (score, record)
+        elif len(self._best) < self.n:
+            self._best[key] = (score, record)
+        else:
+            lowest = self._min_key()
+            if score > self._best[lowest][0]:
+                del self._best[lowest]
+                self._best[key] = (score, record)
+
+    def update(self, scores, make_record):
+        """
+        Offer a chunk of scores, best first, until the chunk cannot change the list.
+
+        Args:
+            scores (numpy.ndarray): Ranking scores
+            make_record (callable): Builds the record for a position in ``scores``;
+                only called for entries that may enter the list
+        """
+        chunk_keys = set()
+        for i in np.argsort(-scores, kind='stable'):
+            score = float(scores[i])
+            if len(self._best) >= self.n and score <= self._best[self._min_key()][0]:
+                break
+            record = make_record(i)
+            chunk_keys.add(self.key(record))
+            self.push(score, record)
+            if len(chunk_keys) >= self.n:
+                break
+
+    def merge(self, other):
+        """Fold another TopN into this one."""
+        for score, record in other._best.values():
+            self.push(score, record)
+
+    def items(self):
+        """Return (score, record) pairs, best first."""
+        return sorted(self._best.values(), key=lambda entry: entry[0], reverse=True)
+
+    def to_dict(self):
+        return {'n': self.n, 'items': [[score, record] for score, record in self.items()]}
+
+    @classmethod
+    def from_dict(cls, data):
+        top = cls(data['n'])
+        for score, record in data['items']:
+            top.push(score, record)
+        return top
+
+
+class SiteStatistics:
+    """Mergeable summary of every observation from one site (or all sites)."""
+
+    def __init__(self, top_n=5):
+        self.price = RunningMoments()
+        self.price_quantiles = QuantileSketch()
+        self.rating = RunningMoments()
+        self.rating_quantiles = QuantileSketch()
+        self.availability = {}
+        self.top_expensive = TopN(top_n)
+        self.top_rated = TopN(top_n)
+        self.best_value = TopN(top_n)
+
+    def update(self, df):
+        """
+        Add a chunk of cleaned laptop rows.
+
+        Args:
+            df (pandas.DataFrame): Cleaned laptop data
+        """
+        price = df['price'].to_numpy(dtype=float)
+        rating = df['rating'].to_numpy(dtype=float) if 'rating' in df.columns else np.full(len(df), np.nan)
+
+        self.price.update(price)
+        self.price_quantiles.update(price)
+        self.rating.update(rating)
+        self.rating_quantiles.update(rating)
+
+        if 'availability' in df.columns:
+            for status, count in df['availability'].value_counts().items():
+                self.availability[status] = self.availability.get(status, 0) + int(count)
+
+        names = df['name'].to_numpy() if 'name' in df.columns else np.full(len(df), UNKNOWN_LAPTOP_NAME)
+        sites = df['site'].to_numpy()
+
+        def make_record(i):
+            return {'name': names[i], 'price': float(price[i]),
+                    'rating': None if np.isnan(rating[i]) else float(rating[i]), 'site': sites[i]}
+
+        valid_price = ~np.isnan(price)
+        rated = valid_price & ~np.isnan(rating) & (price > 0)
+        self._offer(self.top_expensive, price, valid_price, make_record)
+        self._offer(self.top_rated, rating, rated, make_record)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self._offer(self.best_value, rating / price, rated, make_record)
+
+    @staticmethod
+    def _offer(top, scores, keep, make_record):
+        positions = np.flatnonzero(keep)
+        top.update(scores[positions], lambda i: make_record(positions[i]))
+
+    def merge(self, other):
+        """Fold another SiteStatistics into this one."""
+        self.price.merge(other.price)
+        self.price_quantiles.merge(other.price_quantiles)
+        self.rating.merge(other.rating)
+        self.rating_quantiles.merge(other.rating_quantiles)
+        for status, count in other.availability.items():
+            self.availability[status] = self.availability.get(status, 0) + count
+        self.top_expensive.merge(other.top_expensive)
+        self.top_rated.merge(other.top_rated)
+        self.best_value.merge(other.best_value)
+
+    def to_dict(self):
+        return {
+            'price': self.price.to_dict(),
+            'price_quantiles': self.price_quantiles.to_dict(),
+            'rating': self.rating.to_dict(),
+            'rating_quantiles': self.rating_quantiles.to_dict(),
+            'availability': self.availability,
+            'top_expensive': self.top_expensive.to_dict(),
+            'top_rated': self.top_rated.to_dict(),
+            'best_value': self.best_value.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        stats.price = RunningMoments.from_dict(data['price'])
+        stats.price_quantiles = QuantileSketch.from_dict(data['price_quantiles'])
+        stats.rating = RunningMoments.from_dict(data['rating'])
+        stats.rating_quantiles = QuantileSketch.from_dict(data['rating_quantiles'])
+        stats.availability = dict(data['availability'])
+        stats.top_expensive = TopN.from_dict(data['top_expensive'])
+        stats.top_rated = TopN.from_dict(data['top_rated'])
+        stats.best_value = TopN.from_dict(data['best_value'])
+        return stats
+
+
+class PriceHistoryStatistics:
+    """
+    Per-site streaming statistics over every run, persisted as JSON.
+
+    Each run is folded in chunk by chunk; the overall summary is obtained
+    by merging the per-site summaries, never by re-reading past data.
+    """
+
+    def __init__(self, top_n=5):
+        self.top_n = top_n
+        self.runs = 0
+        self.sites = {}
+
+    def update(self, df, chunksize=10000):
+        """
+        Fold a run's cleaned data into the per-site summaries.
+
+        Args:
+            df (pandas.DataFrame): Cleaned laptop data
+            chunksize (int): Number of rows processed at a time
+        """
+        for start in range(0, len(df), chunksize):
+            chunk = df.iloc[start:start + chunksize]
+            for site, group in chunk.groupby('site', sort=False):
+                if site not in self.sites:
+                    self.sites[site] = SiteStatistics(self.top_n)
+                self.sites[site].update(group)
+        self.runs += 1
+
+    def overall(self):
+        """
+        Merge every site into a single summary.
+
+        Returns:
+            SiteStatistics: Summary across all sites
+        """
+        total = SiteStatistics(self.top_n)
+        for stats in self.sites.values():
+            total.merge(stats)
+        return total
+
+    def save(self, path):
+        """
+        Persist the summaries, replacing the previous file atomically.
+
+        Args:
+            path (str): Path to the JSON file
+        """
+        data = {'top_n': self.top_n, 'runs': self.runs,
+                'sites': {site: stats.to_dict() for site, stats in self.sites.items()}}
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, top_n=5):
+        """
+        Load persisted summaries, or start empty if the file does not exist.
+
+        Args:
+            path (str): Path to the JSON file
+            top_n (int): Size of the top-N lists for a new history
+
+        Returns:
+            PriceHistoryStatistics: Loaded summaries
+        """
+        if not os.path.exists(path):
+            return cls(top_n)
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        history = cls(data['top_n'])
+        history.runs = data['runs']
+        history.sites = {site: SiteStatistics.from_dict(stats) for site, stats in data['sites'].items()}
+        return history
@@ -147,4 +147,81 @@ def display_statistics(df):
             for i, (_, row) in enumerate(best_value.iterrows(), 1):
                 print(f"{i}. {row['name'][:50]}{'...' if len(row['name']) > 50 else ''}")
                 print(f"   Value: {row['value_ratio']*100:.2f} | Rating: {row['rating']:.1f}/5.0 | " +
-                      f"Price: ${row['price']:.2f} | Site: {row['site']}")
\ No newline at end of file
+                      f"Price: ${row['price']:.2f} | Site: {row['site']}")
+
+def display_history_statistics(history):
+    """
+    Display statistics accumulated over every run.
+    
+    Args:
+        history (PriceHistoryStatistics): Streaming summaries from utils.streaming_stats
+    """
+    stats = history.overall()
+    if stats.price.count == 0:
+        print("No price history available for analysis.")
+        return
+    
+    # Price statistics (median and percentiles are sketch estimates)
+    print(f"\n{'=' * 40}")
+    print(f"PRICE HISTORY ({history.runs} runs):")
+    print(f"{'=' * 40}")
+    print(f"Observations:     {stats.price.count} prices")
+    print(f"Average Price:    ${stats.price.mean:.2f}")
+    print(f"Median Price:     ~${stats.price_quantiles.quantile(0.5):.2f}")
+    print(f"10th-90th Pct:    ~${stats.price_quantiles.quantile(0.1):.2f} - ~${stats.price_quantiles.quantile(0.9):.2f}")
+    print(f"Minimum Price:    ${stats.price.min:.2f}")
+    print(f"Maximum Price:    ${stats.price.max:.2f}")
+    print(f"Standard Dev:     ${stats.price.std:.2f}")
+    
+    # Rating statistics
+    if stats.rating.count:
+        print(f"\n{'=' * 40}")
+        print("RATING HISTORY:")
+        print(f"{'=' * 40}")
+        print(f"Observations:     {stats.rating.count} ratings")
+        print(f"Average Rating:   {stats.rating.mean:.2f}/5.00")
+        print(f"Median Rating:    ~{stats.rating_quantiles.quantile(0.5):.2f}/5.00")
+    
+    # Per-site statistics
+    print(f"\n{'=' * 40}")
+    print("SITE HISTORY:")
+    print(f"{'=' * 40}")
+    for site, site_stats in history.sites.items():
+        print(f"{site}:".ljust(15) + f"{site_stats.price.count} prices | " +
+              f"avg ${site_stats.price.mean:.2f} | median ~${site_stats.price_quantiles.quantile(0.5):.2f}")
+    
+    # Availability statistics
+    print(f"\n{'=' * 40}")
+    print("AVAILABILITY HISTORY:")
+    print(f"{'=' * 40}")
+    total = sum(stats.availability.values())
+    for status, count in sorted(stats.availability.items(), key=lambda item: -item[1]):
+        print(f"{status}:".ljust(15) + f"{count} observations ({count/total*100:.1f}%)")
+    
+    # Top 5 most expensive laptops
+    print(f"\n{'=' * 40}")
+    print("TOP 5 MOST EXPENSIVE LAPTOPS SEEN:")
+    print(f"{'=' * 40}")
+    for i, (_, row) in enumerate(stats.top_expensive.items(), 1):
+        print(f"{i}. {row['name'][:50]}{'...' if len(row['name']) > 50 else ''}")
+        print(f"   Price: ${row['price']:.2f} | Site: {row['site']} | " +
+              (f"Rating: {row['rating']:.1f}/5.0" if row['rating'] is not None else "Rating: N/A"))
+    
+    # Top 5 highest rated laptops
+    if stats.top_rated.items():
+        print(f"\n{'=' * 40}")
+        print("TOP 5 HIGHEST RATED LAPTOPS SEEN:")
+        print(f"{'=' * 40}")
+        for i, (_, row) in enumerate(stats.top_rated.items(), 1):
+            print(f"{i}. {row['name'][:50]}{'...' if len(row['name']) > 50 else ''}")
+            print(f"   Rating: {row['rating']:.1f}/5.0 | Price: ${row['price']:.2f} | Site: {row['site']}")
+
+    # Best value laptops (highest rating/price ratio)
+    if stats.best_value.items():
+        print(f"\n{'=' * 40}")
+        print("TOP 5 BEST VALUE LAPTOPS SEEN (RATING/PRICE):")
+        print(f"{'=' * 40}")
+        for i, (value_ratio, row) in enumerate(stats.best_value.items(), 1):
+            print(f"{i}. {row['name'][:50]}{'...' if len(row['name']) > 50 else ''}")
+            print(f"   Value: {value_ratio*100:.2f} | Rating: {row['rating']:.1f}/5.0 | " +
+                  f"Price: ${row['price']:.2f} | Site: {row['site']}")